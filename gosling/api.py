@@ -19,7 +19,7 @@ def value(value, **kwargs):
 
 
 class _EncodingMixin:
-    def encode(self: T, *args, **kwargs) -> T:
+    def encode(self: T, *args, _inplace: bool = False, **kwargs) -> T:
         """
         Add channel encodings to the track.
 
@@ -54,24 +54,29 @@ class _EncodingMixin:
         y1e : :class:`Y1e`
 
         ye : :class:`Ye`
+
+        _inplace : bool
+            If True, mutate and return this track instead of a copy. Defaults
+            to False.
         """
+        # Mutate self rather than copying in linear, fluent construction chains.
+        copy = self if _inplace else self.copy()
         # Convert args to kwargs based on their types.
-        copy = self.copy()
         kwargs = utils.infer_encoding_types(args, kwargs, channels)
-        for key, value in kwargs.items():
-            copy[key] = value
+        # SchemaBase item/attribute assignment writes straight to `_kwds`
+        copy._kwds.update(kwargs)
         return copy
 
 
 class _PropertiesMixin:
-    def properties(self: T, **kwargs) -> T:
+    def properties(self: T, *, _inplace: bool = False, **kwargs) -> T:
         """Set top-level properties of the View or Track.
 
         Argument names and types are the same as class initialization.
+        Pass ``_inplace=True`` to mutate and return this object instead of a copy.
         """
-        copy = self.copy()
-        for key, value in kwargs.items():
-            setattr(copy, key, value)
+        copy = self if _inplace else self.copy()
+        copy._kwds.update(kwargs)
         return copy
 
 
@@ -209,11 +214,12 @@ class View(_PropertiesMixin, core.Root):
         if format == "json":
             data = self.to_json(**kwargs)
         elif format == "html":
-            data = display.spec_to_html(self.to_dict(), **kwargs)
+            display.spec_to_html_stream(path, self.to_dict(), **kwargs)
+            return
         else:
             raise ValueError(f"unrecognized format: '{format}'")
 
-        with open(path, mode="w") as f:
+        with open(path, mode="w", encoding="utf-8") as f:
             f.write(data)
 
     def widget(self):
@@ -1,20 +1,26 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
+import re
 import uuid
-from typing import Any, Dict
-
-import jinja2
+from typing import IO, Any, Dict, List
 
 from gosling.plugin_registry import PluginRegistry
 from gosling.schema import SCHEMA_VERSION, THEMES
 
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
 # TODO: Ideally we could use a single import but this seems to work ok.
-HTML_TEMPLATE = jinja2.Template(
-    """
+HTML_SRC = """
 <!DOCTYPE html>
 <html>
 <head>
+  <meta charset="utf-8">
   <style>.error { color: red; }</style>
 </head>
 <body>
@@ -38,7 +44,27 @@ HTML_TEMPLATE = jinja2.Template(
 </body>
 </html>
 """
-)
+
+@functools.lru_cache(maxsize=1)
+def _html_parts() -> List[str]:
+    """Pre-render HTML_SRC into alternating [static, var, static, ..., static] parts.
+
+    The document shell is static, so per-call rendering is just concatenation.
+    Jinja2 is only imported (and the template compiled) on first render.
+    """
+    import jinja2
+    import jinja2.meta
+
+    env = jinja2.Environment(
+        loader=jinja2.DictLoader({"html": HTML_SRC}),
+        auto_reload=False,
+        undefined=jinja2.StrictUndefined,
+    )
+    names = jinja2.meta.find_undeclared_variables(env.parse(HTML_SRC))
+    template = env.get_template("html")
+    static = template.render({name: f"\x00{name}\x00" for name in names})
+    return re.split(r"\x00(\w+)\x00", static)
+
 
 GoslingSpec = Dict[str, Any]
 
@@ -60,21 +86,73 @@ def get_gosling_import_map(
     }
 
 
+@functools.lru_cache(maxsize=32)
+def _dumps_options(items: tuple) -> str:
+    return _dumps({k: v for k, _, v in items})
+
+
+@functools.lru_cache(maxsize=None)
+def _serialize_import_map(**kwargs: str) -> str:
+    return _dumps(get_gosling_import_map(**kwargs))
+
+
+def _serialize_embed_options(embed_options: Dict[str, Any]) -> str:
+    """Serialize embed options, reusing the result for repeated (hashable) options."""
+    # include value types in the key so that e.g. `0` and `False` don't collide
+    key = tuple((k, type(v), v) for k, v in embed_options.items())
+    try:
+        hash(key)
+    except TypeError:
+        # unhashable values (e.g., a custom theme dict)
+        return _dumps(embed_options)
+    return _dumps_options(key)
+
+
+def _template_context(
+    spec: GoslingSpec,
+    output_div: str,
+    embed_options: Dict[str, Any] | None,
+    **kwargs,
+) -> Dict[str, str]:
+    embed_options = embed_options or dict(padding=0, theme=themes.get())
+    return dict(
+        spec=_dumps(spec),
+        embed_options=_serialize_embed_options(embed_options),
+        output_div=output_div,
+        import_map=_serialize_import_map(**kwargs),
+    )
+
+
+def _html_chunks(context: Dict[str, str]) -> List[str]:
+    return [context[part] if i % 2 else part for i, part in enumerate(_html_parts())]
+
+
 def spec_to_html(
     spec: GoslingSpec,
     output_div: str = "vis",
     embed_options: Dict[str, Any] | None = None,
     **kwargs,
 ):
-    embed_options = embed_options or dict(padding=0, theme=themes.get())
-    deps = get_gosling_import_map(**kwargs)
+    context = _template_context(spec, output_div, embed_options, **kwargs)
+    return "".join(_html_chunks(context))
 
-    return HTML_TEMPLATE.render(
-        spec=json.dumps(spec),
-        embed_options=json.dumps(embed_options),
-        output_div=output_div,
-        import_map=json.dumps(deps),
-    )
+
+def spec_to_html_stream(
+    fp: IO[str] | str | os.PathLike,
+    spec: GoslingSpec,
+    output_div: str = "vis",
+    embed_options: Dict[str, Any] | None = None,
+    **kwargs,
+) -> None:
+    """Like `spec_to_html`, but streams the document into a file (or path)
+    without materializing the full HTML string."""
+    # serialize everything up front so a failure never leaves a truncated file
+    chunks = _html_chunks(_template_context(spec, output_div, embed_options, **kwargs))
+    if isinstance(fp, (str, os.PathLike)):
+        with open(fp, "w", encoding="utf-8") as f:
+            f.writelines(chunks)
+    else:
+        fp.writelines(chunks)
 
 
 class Renderer:
@@ -92,8 +170,7 @@ class Renderer:
 
 class HTMLRenderer(Renderer):
     def __call__(self, spec: GoslingSpec, **meta: Any):
-        kwargs = self.kwargs.copy()
-        kwargs.update(meta)
+        kwargs = {**self.kwargs, **meta} if meta else self.kwargs
         html = spec_to_html(spec=spec, output_div=self.output_div, **kwargs)
         return {"text/html": html}
 
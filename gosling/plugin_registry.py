@@ -1,5 +1,5 @@
 # derived from https://github.com/altair-viz/altair/blob/8a8642b2e7eeee3b914850a8f7aacd53335302d9/altair/utils/plugin_registry.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TypeVar, Any, Generic, Dict, Union, List, cast
 import sys
 import functools
@@ -16,6 +16,14 @@ class ActivePlugin(Generic[PluginType]):
     name: str
     plugin: PluginType
     options: Dict[str, Any]
+    bound: Any = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # bind options once on enable rather than on every `get()`
+        if self.options and callable(self.plugin):
+            self.bound = functools.partial(self.plugin, **self.options)
+        else:
+            self.bound = self.plugin
 
 class PluginEnabler(Generic[PluginType]):
     """Context manager for enabling plugins.
@@ -160,10 +168,7 @@ class PluginRegistry(Generic[PluginType]):
 
     def get(self) -> Union[None, PluginType]:
         """Return the currently active plugin."""
-        if active := self._active:
-            if active.options and callable(active.plugin):
-                return functools.partial(active.plugin, **active.options)
-            return active.plugin
+        return None if self._active is None else self._active.bound
 
     def __repr__(self) -> str:
         return "{}(active={!r}, registered={!r})" "".format(
@@ -1,18 +1,14 @@
 import ast
 import dataclasses
-import io
-import itertools
 import pathlib
 import re
-import tokenize
-from typing import Iterable, Optional, Tuple, TypeVar
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
 import jinja2
 
 from gosling.examples import iter_examples
 
-GALLERY_TEMPLATE = jinja2.Template(
-    """
+GALLERY_SRC = """
 .. This document is auto-generated by the gosling-gallery extension. Do not modify directly.
 
 .. _{{ gallery_ref }}:
@@ -35,10 +31,8 @@ This gallery contains a selection of examples of the visualizations **gos** can
 
 {%- endfor %}
 """
-)
 
-EXAMPLE_TEMPLATE = jinja2.Template(
-    """
+EXAMPLE_SRC = """
 .. This document is auto-generated by the gosling-gallery extension. Do not modify directly.
 
 .. _gallery_{{ name }}:
@@ -50,8 +44,15 @@ EXAMPLE_TEMPLATE = jinja2.Template(
 
     {{ code | indent(4) }}
 """
+
+# Templates are compiled once per process and reused across rebuilds.
+_env = jinja2.Environment(
+    loader=jinja2.DictLoader({"gallery": GALLERY_SRC, "example": EXAMPLE_SRC}),
+    auto_reload=False,
 )
 
+_CATEGORY_RE = re.compile(r"^#\s*category:\s*(.*)$", re.MULTILINE)
+
 
 @dataclasses.dataclass
 class Example:
@@ -63,62 +64,79 @@ class Example:
 
     @classmethod
     def from_file(cls, file: pathlib.Path):
+        key = (str(file), file.stat().st_mtime_ns)
+        if key in _example_cache:
+            return _example_cache[key]
+
         content = file.read_text()
         # change from Windows format to UNIX for uniformity
         content = content.replace("\r\n", "\n")
-        docstring = ast.get_docstring(ast.parse(content)) or ""
+        tree = ast.parse(content)
+        # gallery docstrings are not indented, so only surrounding newlines need trimming
+        docstring = (ast.get_docstring(tree, clean=False) or "").strip()
 
         # Find the category comment
-        find_category = re.compile(r"^#\s*category:\s*(.*)$", re.MULTILINE)
-        match = find_category.search(content)
+        match = _CATEGORY_RE.search(content)
         if match is not None:
             category = match.groups()[0]
-            # remove this comment from the content
-            content = find_category.sub("", content)
+            # remove this comment from the content (line numbers are preserved)
+            content = _CATEGORY_RE.sub("", content)
         else:
             category = "other"
 
-        ts = tokenize.tokenize(io.BytesIO(content.encode("utf-8")).readline)
+        # get the end row of the module docstring, if any
         ds_lines = 0
-        # find the first string according to the tokenizer and get
-        # it's end row
-        for tk in ts:
-            if tk.exact_type == 3:
-                ds_lines, _ = tk.end
-                break
+        if tree.body:
+            first = tree.body[0]
+            # same rule as `ast.get_docstring`: a leading str constant
+            if (
+                isinstance(first, ast.Expr)
+                and isinstance(first.value, ast.Constant)
+                and isinstance(first.value.value, str)
+            ):
+                ds_lines = first.end_lineno or 0
         # grab the rest of the file
-        rest = "\n".join(content.split("\n")[ds_lines:])
+        parts = content.split("\n", ds_lines)
+        rest = parts[ds_lines] if len(parts) > ds_lines else ""
         lineno = ds_lines + 1
 
-        return cls(
+        example = cls(
             name=file.stem,
             docstring=docstring,
             code=rest,
             lineno=lineno,
             category=category,
         )
+        _example_cache[key] = example
+        return example
+
+
+# Parsed examples keyed by (path, mtime) so unchanged files aren't re-parsed
+# across rebuilds within the same Sphinx process (e.g., sphinx-autobuild)
+_example_cache: Dict[Tuple[str, int], Example] = {}
 
 
 T = TypeVar("T")
 
 
 def prev_this_next(
-    it: Iterable[T], sentinel=None
-) -> Iterable[Tuple[Optional[T], T, Optional[T]]]:
-    """Utility to return (prev, this, next) tuples from an iterator"""
-    i1, i2, i3 = itertools.tee(it, 3)
-    next(i3, None)
-    return zip(itertools.chain([sentinel], i1), i2, itertools.chain(i3, [sentinel]))
+    seq: Sequence[T], sentinel=None
+) -> Iterator[Tuple[Optional[T], T, Optional[T]]]:
+    """Utility to return (prev, this, next) tuples from a sequence"""
+    last = len(seq) - 1
+    for i, this in enumerate(seq):
+        prev = seq[i - 1] if i > 0 else sentinel
+        next_ = seq[i + 1] if i < last else sentinel
+        yield prev, this, next_
 
 
-def populate_examples():
-    return sorted(
-        filter(
-            lambda e: e.category != "skip",
-            map(Example.from_file, iter_examples()),
-        ),
-        key=lambda e: e.category,
-    )
+def populate_examples() -> Dict[str, List[Example]]:
+    """Group examples by category, with categories in alphabetical order"""
+    buckets: Dict[str, List[Example]] = {}
+    for example in map(Example.from_file, iter_examples()):
+        if example.category != "skip":
+            buckets.setdefault(example.category, []).append(example)
+    return {category: buckets[category] for category in sorted(buckets)}
 
 
 def main(app):
@@ -131,19 +149,19 @@ def main(app):
     if not target_dir.is_dir():
         target_dir.mkdir(parents=True)
 
-    examples = populate_examples()
-    example_groups = itertools.groupby(examples, key=lambda e: e.category)
-
-    # Write the gallery index file
-    with open(target_dir / "index.rst", "w") as f:
-        f.write(
-            GALLERY_TEMPLATE.render(
-                title=title,
-                example_groups=example_groups,
-                gallery_ref=gallery_ref,
-            )
+    example_groups = populate_examples()
+    examples = [e for group in example_groups.values() for e in group]
+
+    # Render the gallery index and example pages
+    pages = {
+        target_dir / "index.rst": _env.get_template("gallery").render(
+            title=title,
+            example_groups=example_groups.items(),
+            gallery_ref=gallery_ref,
         )
+    }
 
+    example_template = _env.get_template("example")
     for prev_ex, example, next_ex in prev_this_next(examples):
         ex = dataclasses.asdict(example)
         ex["code_below"] = True
@@ -151,8 +169,10 @@ def main(app):
             ex["prev_ref"] = f"gallery_{prev_ex.name}"
         if next_ex:
             ex["next_ref"] = f"gallery_{next_ex.name}"
-        with open(target_dir / (example.name + ".rst"), "w") as f:
-            f.write(EXAMPLE_TEMPLATE.render(ex))
+        pages[target_dir / (example.name + ".rst")] = example_template.render(ex)
+
+    for path, text in pages.items():
+        path.write_text(text)
 
 
 def setup(app):
@@ -1,3 +1,5 @@
+import pathlib
+
 import pytest
 
 import gosling as gos
@@ -32,6 +34,23 @@ def test_basic_view(basic_track: gos.Track) -> None:
     assert view.to_dict() == {"tracks": [basic_track.to_dict()]}
 
 
+def test_inplace(basic_track: gos.Track) -> None:
+    track = basic_track.encode(color="foo:N")
+    assert track is not basic_track
+    assert basic_track.color is gos.Undefined
+
+    track = basic_track.encode(color="foo:N", _inplace=True)
+    assert track is basic_track
+    assert basic_track.color == gos.Color("foo:N")
+
+    track = basic_track.properties(width=10, _inplace=True)
+    assert track is basic_track
+    assert basic_track.width == 10
+
+    with pytest.raises(TypeError):
+        basic_track.properties(True)
+
+
 def test_transforms(basic_track: gos.Track) -> None:
     # filter transform
     track = basic_track.transform_filter("position", oneOf=["+"])
@@ -190,3 +209,13 @@ def test_view_composition(basic_track: gos.Track) -> None:
     assert len(view.views) == 4
     for v in view.views:
         assert isinstance(v, gos.View)
+
+
+def test_save_html_error_keeps_file(
+    basic_track: gos.Track, tmp_path: pathlib.Path
+) -> None:
+    path = tmp_path / "view.html"
+    path.write_text("ORIGINAL")
+    with pytest.raises(TypeError):
+        basic_track.view().save(path, bogus=1)
+    assert path.read_text() == "ORIGINAL"
@@ -1,3 +1,5 @@
+import pytest
+
 import gosling.data as data
 
 
@@ -12,3 +14,11 @@ def test_data():
 
     values = [{"x": 1, "y": 2}]
     assert data.json(values) == {"type": "json", "values": values}
+
+
+def test_data_conflicting_kwargs():
+    url = "http://localhost:8080/data.csv"
+    with pytest.raises(TypeError):
+        data.csv(url, type="bigwig")
+    with pytest.raises(TypeError):
+        data.json([], type="csv")
@@ -0,0 +1,39 @@
+import io
+import pathlib
+
+import pytest
+
+import gosling.display as display
+
+SPEC = {"tracks": [{"mark": "point", "title": "é"}]}
+
+
+def test_spec_to_html_stream(tmp_path: pathlib.Path) -> None:
+    expected = display.spec_to_html(SPEC)
+
+    buf = io.StringIO()
+    display.spec_to_html_stream(buf, SPEC)
+    assert buf.getvalue() == expected
+
+    path = tmp_path / "spec.html"
+    display.spec_to_html_stream(path, SPEC)
+    assert path.read_text(encoding="utf-8") == expected
+
+    display.spec_to_html_stream(str(path), SPEC, higlass_version="1.12")
+    assert path.read_text(encoding="utf-8") == display.spec_to_html(
+        SPEC, higlass_version="1.12"
+    )
+
+
+def test_dumps() -> None:
+    assert display._dumps({"a": "é", "b": [1, 2.5, None]}) == '{"a":"é","b":[1,2.5,null]}'
+    assert display._dumps({"x": float("nan")}) == '{"x":NaN}'
+
+
+def test_serialize_embed_options() -> None:
+    assert display._serialize_embed_options({"padding": 0}) == '{"padding":0}'
+    assert display._serialize_embed_options({"padding": False}) == '{"padding":false}'
+    theme = {"theme": {"base": "light"}}
+    assert display._serialize_embed_options(theme) == '{"theme":{"base":"light"}}'
+    with pytest.raises(TypeError):
+        display._serialize_embed_options({"x": frozenset()})
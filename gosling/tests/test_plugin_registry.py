@@ -1,4 +1,4 @@
-from gosling.plugin_registry import PluginRegistry
+from gosling.plugin_registry import ActivePlugin, PluginRegistry
 from typing import Callable
 
 
@@ -90,3 +90,10 @@ def test_plugin_registry_context():
 
     assert plugins.active == "default"
     assert plugins.options == {"p": 2}
+
+
+def test_active_plugin_equality():
+    def plugin(x, p=2):
+        return x**p
+
+    assert ActivePlugin("a", plugin, {"p": 3}) == ActivePlugin("a", plugin, {"p": 3})
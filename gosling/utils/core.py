@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import itertools
 import re
@@ -65,6 +66,23 @@ def parse_shorthand(
     return attrs
 
 
+@functools.lru_cache(maxsize=None)
+def _channel_mappings(channels):
+    """Build (and cache) the channel type <-> encoding name lookups for a module"""
+    # Construct a dictionary of channel type to encoding name
+    channel_objs = (getattr(channels, name) for name in dir(channels))
+    channel_objs = (
+        c for c in channel_objs if isinstance(c, type) and issubclass(c, SchemaBase)
+    )
+    channel_to_name = {c: c._encoding_name for c in channel_objs}
+    name_to_channel = {}
+    for chan, name in channel_to_name.items():
+        chans = name_to_channel.setdefault(name, {})
+        key = "value" if chan.__name__.endswith("Value") else "field"
+        chans[key] = chan
+    return channel_to_name, name_to_channel
+
+
 def infer_encoding_types(args, kwargs, channels):
     """Infer typed keyword arguments for args and kwargs
     Parameters
@@ -81,18 +99,7 @@ def infer_encoding_types(args, kwargs, channels):
         All args and kwargs in a single dict, with keys and types
         based on the channels mapping.
     """
-    # Construct a dictionary of channel type to encoding name
-    # TODO: cache this somehow?
-    channel_objs = (getattr(channels, name) for name in dir(channels))
-    channel_objs = (
-        c for c in channel_objs if isinstance(c, type) and issubclass(c, SchemaBase)
-    )
-    channel_to_name = {c: c._encoding_name for c in channel_objs}
-    name_to_channel = {}
-    for chan, name in channel_to_name.items():
-        chans = name_to_channel.setdefault(name, {})
-        key = "value" if chan.__name__.endswith("Value") else "field"
-        chans[key] = chan
+    channel_to_name, name_to_channel = _channel_mappings(channels)
 
     # First use the mapping to convert args to kwargs based on their types.
     for arg in args:
@@ -435,8 +435,8 @@ def main(tag_name: str, skip_download: Optional[bool] = False):
         f.write("from .channels import *\n")
         f.write(f"SCHEMA_VERSION = {repr(tag_name)}\n")
         f.write(f"SCHEMA_URL = {repr(schema_url(library, tag_name))}\n")
-        # sort themes alphabetically, change from list to set
-        f.write(f"THEMES = {sorted(themes)}\n".replace("[", "{").replace("]", "}"))
+        # sort themes alphabetically, change from list to frozenset
+        f.write(f"THEMES = frozenset({sorted(themes)})\n".replace("[", "{").replace("]", "}"))
 
     # Generate the core schema wrappers
     outfile = schemapath / "core.py"